@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import assessment, tts_gtts
+from app.api.v1.endpoints import assessment, models, progress, tts_gtts
 
 # This is the main router for the v1 API.
 # It will include all the individual endpoint routers.
@@ -24,9 +24,25 @@ api_router.include_router(
     tags=["TTS"]
 )
 
+# Include the model registry status router
+api_router.include_router(
+    models.router,
+    prefix="/models",
+    tags=["Models"]
+)
+
+# Include the learner progress (score history) router
+api_router.include_router(
+    progress.router,
+    prefix="/progress",
+    tags=["Progress"]
+)
+
 # --- Verification Print Statement ---
 # This print statement helps us confirm that this file is being loaded
 # when the application starts up.
 print("--- Loading v1 API Router (api.py) ---")
 print("Included assessment router under /assessment prefix.")
-print("Included tts router under /tts prefix.")
\ No newline at end of file
+print("Included tts router under /tts prefix.")
+print("Included models router under /models prefix.")
+print("Included progress router under /progress prefix.")
\ No newline at end of file
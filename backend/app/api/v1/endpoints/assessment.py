@@ -1,15 +1,22 @@
 # backend/app/api/v1/endpoints/assessment.py
 
+import json
 import string
-from typing import List
+import asyncio
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from g2p_en import G2p
 
 # --- MODIFIED: Import all three services ---
 from app.services.asr_service import ASRService
 from app.services.gop_service import GOPService
 from app.services.feedback_service import FeedbackService
-from app.schemas.assessment_schemas import AssessorResponse, WordAnalysis, PhonemeScore
+from app.services.score_history_service import ScoreHistoryService
+from app.core.config import WHISPER_MODELS, GOP_MODELS, FEEDBACK_THRESHOLD
+from app.schemas.assessment_schemas import AssessorResponse, CheckerResponse, WordAnalysis, PhonemeScore
 
 router = APIRouter()
 
@@ -17,51 +24,72 @@ router = APIRouter()
 asr_service = ASRService()
 gop_service = GOPService()
 feedback_service = FeedbackService()
+score_history_service = ScoreHistoryService()
 g2p = G2p()
 
-# Define the score below which we generate a tip
-FEEDBACK_THRESHOLD = 3.5
+def _validate_model_tier(model_tier: Optional[str]):
+    if model_tier is not None and (model_tier not in WHISPER_MODELS or model_tier not in GOP_MODELS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown model tier '{model_tier}'. Choose one of: {', '.join(WHISPER_MODELS)}"
+        )
 
 def normalize_text(text: str) -> str:
     text = text.lower()
     text = text.translate(str.maketrans('', '', string.punctuation.replace("'", "")))
     return text
 
-def _map_phonemes_to_words(text: str, scored_phonemes: List[dict]) -> List[WordAnalysis]:
+def _group_phonemes_by_word(text: str, scored_phonemes: List[dict]) -> List[Tuple[str, List[dict]]]:
+    """
+    Splits the flat list of scored phonemes from the GOP service into one slice per word.
+    """
     words = text.split()
     phoneme_cursor = 0
-    word_analyses = []
+    grouped = []
 
     for word in words:
         word_phonemes_arpabet = [p for p in g2p(word) if p.strip() and p not in [' ', ',', '.', '!', '?']]
         num_phonemes_in_word = len(word_phonemes_arpabet)
         
         current_word_scores = scored_phonemes[phoneme_cursor : phoneme_cursor + num_phonemes_in_word]
-        
-        phoneme_scores_for_word = []
-        for scored_phoneme in current_word_scores:
-            # --- MODIFIED: Logic for getting feedback ---
-            feedback = None
-            if scored_phoneme['score'] < FEEDBACK_THRESHOLD:
-                # If score is low, call the feedback service
-                print(f"Score for {scored_phoneme['phoneme']} is low ({scored_phoneme['score']}). Generating tip.")
-                feedback = feedback_service.get_pronunciation_tip(
-                    phoneme=scored_phoneme['phoneme'],
-                    word=word,
-                    reference_text=text
-                )
+        grouped.append((word, current_word_scores))
+        phoneme_cursor += num_phonemes_in_word
+
+    return grouped
 
+def _score_words(text: str, scored_phonemes: List[dict]) -> Tuple[List[WordAnalysis], List[Tuple[int, int, str, str]]]:
+    """
+    Builds the WordAnalysis list without feedback tips, plus the tips still to generate
+    as (word_index, phoneme_index, word, phoneme) for every phoneme below FEEDBACK_THRESHOLD.
+    """
+    word_analyses = []
+    pending_tips = []
+
+    for word_index, (word, current_word_scores) in enumerate(_group_phonemes_by_word(text, scored_phonemes)):
+        phoneme_scores_for_word = []
+        for phoneme_index, scored_phoneme in enumerate(current_word_scores):
             phoneme_scores_for_word.append(
-                PhonemeScore(
-                    phoneme=scored_phoneme['phoneme'],
-                    score=scored_phoneme['score'],
-                    feedback_tip=feedback # Add the tip to the response
-                )
+                PhonemeScore(phoneme=scored_phoneme['phoneme'], score=scored_phoneme['score'])
             )
+            if scored_phoneme['score'] < FEEDBACK_THRESHOLD:
+                pending_tips.append((word_index, phoneme_index, word, scored_phoneme['phoneme']))
 
         word_analyses.append(WordAnalysis(word=word, phonemes=phoneme_scores_for_word))
-        phoneme_cursor += num_phonemes_in_word
-    
+
+    return word_analyses, pending_tips
+
+def _map_phonemes_to_words(text: str, scored_phonemes: List[dict]) -> List[WordAnalysis]:
+    word_analyses, pending_tips = _score_words(text, scored_phonemes)
+
+    for word_index, phoneme_index, word, phoneme in pending_tips:
+        # If score is low, call the feedback service
+        print(f"Score for {phoneme} is low. Generating tip.")
+        word_analyses[word_index].phonemes[phoneme_index].feedback_tip = feedback_service.get_pronunciation_tip(
+            phoneme=phoneme,
+            word=word,
+            reference_text=text
+        )
+
     return word_analyses
 
 
@@ -72,16 +100,23 @@ def _map_phonemes_to_words(text: str, scored_phonemes: List[dict]) -> List[WordA
 )
 async def assess_pronunciation(
     reference_text: str = Form(...),
-    audio_file: UploadFile = File(...)
+    audio_file: UploadFile = File(...),
+    model_tier: Optional[str] = Form(None),
+    learner_id: Optional[str] = Form(None)
 ):
     """
     Phase 3: Full Pipeline (Checker, Assessor, Diagnostician).
+    'model_tier' picks the Whisper/GOP models (e.g. 'quick', 'default', 'graded').
+    If 'learner_id' is given, the phoneme scores are added to that learner's score history.
     """
+    _validate_model_tier(model_tier)
     try:
         audio_bytes = await audio_file.read()
         
+        # The model calls are blocking, so they run in the threadpool to keep the
+        # event loop (and any open assessment streams) responsive.
         # Stage 1: The Checker (ASR)
-        user_transcript = asr_service.transcribe(audio_bytes)
+        user_transcript = await run_in_threadpool(asr_service.transcribe, audio_bytes, model_tier)
         normalized_reference = normalize_text(reference_text)
         normalized_transcript = normalize_text(user_transcript)
         is_correct = (normalized_reference == normalized_transcript)
@@ -90,20 +125,133 @@ async def assess_pronunciation(
         if is_correct:
             # Stage 2: The Assessor (GOP)
             print("Transcription correct. Proceeding to phoneme assessment...")
-            phoneme_scores = gop_service.get_phoneme_scores(audio_bytes, reference_text)
+            phoneme_scores = await run_in_threadpool(gop_service.get_phoneme_scores, audio_bytes, reference_text, model_tier)
             
             # Stage 3: The Diagnostician (LLM)
             print("Mapping phonemes and generating feedback for low scores...")
-            word_analysis_list = _map_phonemes_to_words(reference_text, phoneme_scores)
+            word_analysis_list = await run_in_threadpool(_map_phonemes_to_words, reference_text, phoneme_scores)
         
-        return AssessorResponse(
+        response = AssessorResponse(
             is_correct=is_correct,
             user_transcript=user_transcript,
             words=word_analysis_list
         )
+        if learner_id:
+            # Queued for the background writer, so this doesn't delay the response.
+            score_history_service.record(learner_id, response)
+        return response
 
     except Exception as e:
         import traceback
         print(f"An error occurred during assessment: {e}")
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _ndjson_event(event: str, data) -> bytes:
+    """
+    Encodes a single streaming event as one line of newline-delimited JSON.
+    """
+    return (json.dumps({"event": event, "data": jsonable_encoder(data)}) + "\n").encode("utf-8")
+
+
+async def _assessment_event_stream(
+    audio_bytes: bytes,
+    reference_text: str,
+    model_tier: Optional[str] = None,
+    learner_id: Optional[str] = None
+):
+    """
+    Runs the same three stages as assess_pronunciation, but yields each result as soon as it is ready:
+
+      checker  -> CheckerResponse, right after ASR
+      word     -> {"index": i, "word": WordAnalysis} for each word, once GOP scores are in (tips not yet filled)
+      feedback -> {"word_index": i, "phoneme_index": j, "feedback_tip": str} for each tip, in completion order
+      result   -> the final AssessorResponse, identical to the non-streaming endpoint
+      error    -> {"detail": str} if any stage fails (the HTTP status is already 200 by then)
+
+    The model calls are blocking, so they run in the threadpool to let each event flush to the client.
+    """
+    try:
+        # Stage 1: The Checker (ASR)
+        user_transcript = await run_in_threadpool(asr_service.transcribe, audio_bytes, model_tier)
+        normalized_reference = normalize_text(reference_text)
+        normalized_transcript = normalize_text(user_transcript)
+        is_correct = (normalized_reference == normalized_transcript)
+        yield _ndjson_event("checker", CheckerResponse(is_correct=is_correct, user_transcript=user_transcript))
+
+        word_analysis_list = []
+        if is_correct:
+            # Stage 2: The Assessor (GOP)
+            print("Transcription correct. Proceeding to phoneme assessment (streaming)...")
+            phoneme_scores = await run_in_threadpool(gop_service.get_phoneme_scores, audio_bytes, reference_text, model_tier)
+
+            word_analysis_list, pending_tips = _score_words(reference_text, phoneme_scores)
+            for word_index, word_analysis in enumerate(word_analysis_list):
+                yield _ndjson_event("word", {"index": word_index, "word": word_analysis})
+
+            # Stage 3: The Diagnostician (LLM)
+            # Tips are requested concurrently and streamed in whatever order they come back.
+            async def _fetch_tip(word_index, phoneme_index, word, phoneme):
+                print(f"Score for {phoneme} is low. Generating tip.")
+                tip = await run_in_threadpool(
+                    feedback_service.get_pronunciation_tip,
+                    phoneme=phoneme,
+                    word=word,
+                    reference_text=reference_text
+                )
+                return word_index, phoneme_index, tip
+
+            tip_tasks = [asyncio.create_task(_fetch_tip(*pending)) for pending in pending_tips]
+            try:
+                for next_tip in asyncio.as_completed(tip_tasks):
+                    word_index, phoneme_index, tip = await next_tip
+                    word_analysis_list[word_index].phonemes[phoneme_index].feedback_tip = tip
+                    yield _ndjson_event(
+                        "feedback",
+                        {"word_index": word_index, "phoneme_index": phoneme_index, "feedback_tip": tip}
+                    )
+            finally:
+                # If the client disconnects, don't keep paying for tips nobody will read.
+                for task in tip_tasks:
+                    if not task.done():
+                        task.cancel()
+
+        response = AssessorResponse(
+            is_correct=is_correct,
+            user_transcript=user_transcript,
+            words=word_analysis_list
+        )
+        if learner_id:
+            score_history_service.record(learner_id, response)
+        yield _ndjson_event("result", response)
+
+    except Exception as e:
+        import traceback
+        print(f"An error occurred during streaming assessment: {e}")
+        traceback.print_exc()
+        yield _ndjson_event("error", {"detail": str(e)})
+
+
+@router.post(
+    "/stream",
+    summary="Assess Pronunciation (Streaming, NDJSON)",
+    response_class=StreamingResponse
+)
+async def assess_pronunciation_stream(
+    reference_text: str = Form(...),
+    audio_file: UploadFile = File(...),
+    model_tier: Optional[str] = Form(None),
+    learner_id: Optional[str] = Form(None)
+):
+    """
+    Same pipeline as the full assessment, streamed as newline-delimited JSON events
+    so the client can show the transcript before GOP scoring and LLM tips are done.
+    The last event ("result") carries the complete AssessorResponse.
+    """
+    _validate_model_tier(model_tier)
+    audio_bytes = await audio_file.read()
+    return StreamingResponse(
+        _assessment_event_stream(audio_bytes, reference_text, model_tier, learner_id),
+        media_type="application/x-ndjson"
+    )
@@ -0,0 +1,28 @@
+# backend/app/api/v1/endpoints/models.py
+
+from fastapi import APIRouter
+
+from app.core.config import WHISPER_MODELS, GOP_MODELS
+from app.services.model_registry import ModelRegistry
+
+router = APIRouter()
+model_registry = ModelRegistry()
+
+
+@router.get(
+    "/",
+    summary="List Model Tiers and Resident Models"
+)
+def get_model_status():
+    """
+    Returns the available model tiers, the models currently loaded with their
+    estimated resident memory, the memory budget and recent load/evict events.
+    """
+    return {
+        "tiers": {
+            tier: {"whisper": WHISPER_MODELS[tier], "gop": GOP_MODELS.get(tier)}
+            for tier in WHISPER_MODELS
+        },
+        **model_registry.stats(),
+    }
+
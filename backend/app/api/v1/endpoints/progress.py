@@ -0,0 +1,44 @@
+# backend/app/api/v1/endpoints/progress.py
+
+from fastapi import APIRouter, Query
+
+from app.services.score_history_service import ScoreHistoryService
+from app.schemas.progress_schemas import LearnerProgressResponse
+
+router = APIRouter()
+score_history_service = ScoreHistoryService()
+
+
+@router.get(
+    "/{learner_id}",
+    response_model=LearnerProgressResponse,
+    summary="Get a Learner's Phoneme Score Trends"
+)
+def get_learner_progress(learner_id: str):
+    """
+    Returns mean score, recent mean score and the number of attempts below the
+    feedback threshold for every phoneme the learner has been assessed on.
+    """
+    return LearnerProgressResponse(
+        learner_id=learner_id,
+        phonemes=score_history_service.get_phoneme_stats(learner_id)
+    )
+
+
+@router.get(
+    "/{learner_id}/weakest",
+    response_model=LearnerProgressResponse,
+    summary="Get a Learner's Weakest Phonemes"
+)
+def get_weakest_phonemes(
+    learner_id: str,
+    limit: int = Query(5, ge=1, le=50),
+    min_attempts: int = Query(3, ge=1)
+):
+    """
+    Returns the learner's weakest phonemes (lowest recent mean score first), for lesson targeting.
+    """
+    return LearnerProgressResponse(
+        learner_id=learner_id,
+        phonemes=score_history_service.get_weakest_phonemes(learner_id, limit=limit, min_attempts=min_attempts)
+    )
@@ -2,17 +2,34 @@
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from typing import Optional
 import io
+import itertools
 
-from app.services.tts_gtts_service import TTSService
+from app.core.config import TTS_BACKEND
+
+# Pick the TTS backend from config. Imports are deferred so unused backends
+# (and their dependencies / API keys) are not required.
+if TTS_BACKEND == "openai":
+    from app.services.tts_openai_service import TTSService
+elif TTS_BACKEND == "stub":
+    from app.services.tts_stub_service import TTSService
+else:
+    from app.services.tts_gtts_service import TTSService
 
 router = APIRouter()
 tts_service = TTSService()
 
 class TTSRequest(BaseModel):
     text: str
-    voice: str = "en" 
+    # Language code for gTTS ('en'), voice name for OpenAI ('alloy').
+    # Left out, each backend uses its own default.
+    voice: Optional[str] = None
+
+def _voice_kwargs(request: TTSRequest) -> dict:
+    return {"voice": request.voice} if request.voice else {}
 
 @router.post(
     "/",
@@ -22,15 +39,38 @@ class TTSRequest(BaseModel):
 async def generate_speech_endpoint(request: TTSRequest):
     """
     Generate audio from text using the TTS service.
-    The 'voice' parameter should be a language code like 'en', 'es', 'fr'.
+    The 'voice' parameter is a language code like 'en', 'es', 'fr' for gTTS,
+    or a voice name like 'alloy' for OpenAI. If omitted, the backend's default is used.
     """
     try:
         # The rest of the code works perfectly without changes.
-        audio_bytes = tts_service.generate_speech(request.text, request.voice)
+        audio_bytes = tts_service.generate_speech(request.text, **_voice_kwargs(request))
         if audio_bytes:
             return StreamingResponse(io.BytesIO(audio_bytes), media_type="audio/mpeg")
         else:
             raise HTTPException(status_code=500, detail="Failed to generate audio.")
 
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/stream",
+    summary="Generate Speech from Text (Streaming)",
+    response_class=StreamingResponse
+)
+async def generate_speech_stream_endpoint(request: TTSRequest):
+    """
+    Generate audio sentence by sentence and stream the MP3 as soon as the first
+    sentence is ready, instead of waiting for the whole text to be synthesized.
+    """
+    audio_chunks = tts_service.generate_speech_stream(request.text, **_voice_kwargs(request))
+    try:
+        # Wait for the first segment here so a failure can still be reported as a 500.
+        first_chunk = await run_in_threadpool(next, audio_chunks, None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if first_chunk is None:
+        raise HTTPException(status_code=500, detail="Failed to generate audio.")
+
+    return StreamingResponse(itertools.chain([first_chunk], audio_chunks), media_type="audio/mpeg")
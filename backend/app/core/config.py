@@ -10,6 +10,57 @@ Project-wide configuration settings.
 WHISPER_MODEL_NAME = "base.en"
 
 GOP_MODEL_NAME = "moxeeeem/wav2vec2-finetuned-pronunciation-correction"
+
+# Model tiers a request can choose from. "default" keeps the models above.
+WHISPER_MODELS = {
+    "quick": "tiny.en",      # fast drills
+    "default": WHISPER_MODEL_NAME,
+    "graded": "small.en",    # graded tests
+}
+GOP_MODELS = {
+    "quick": GOP_MODEL_NAME,
+    "default": GOP_MODEL_NAME,
+    "graded": GOP_MODEL_NAME,
+}
+DEFAULT_MODEL_TIER = "default"
+
+# Rough resident size of each model in MB (fp32 weights), so the registry can
+# make room before a model's first load. After a load the measured size is used.
+MODEL_SIZE_ESTIMATES_MB = {
+    "whisper:tiny.en": 75,
+    "whisper:base.en": 145,
+    "whisper:small.en": 485,
+    f"gop:{GOP_MODEL_NAME}": 1270,
+}
+
+# RAM budget for all lazily loaded models, in MB. The least recently used
+# model is evicted when loading another one would go over it.
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "4096"))
+# Comma separated "kind:name" keys that are never evicted once loaded. Defaults to the "default" tier.
+PINNED_MODELS = [
+    m.strip()
+    for m in os.getenv("PINNED_MODELS", f"whisper:{WHISPER_MODEL_NAME},gop:{GOP_MODEL_NAME}").split(",")
+    if m.strip()
+]
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-LLM_MODEL_NAME = "gemini-1.5-flash-latest"
\ No newline at end of file
+LLM_MODEL_NAME = "gemini-1.5-flash-latest"
+
+# Text-to-speech backend used by the /tts endpoint: "gtts", "openai" or "stub" (offline, for tests).
+TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts")
+# Max sentences synthesized at once across all streaming TTS requests.
+TTS_MAX_WORKERS = int(os.getenv("TTS_MAX_WORKERS", "4"))
+# Segment length bounds: shorter pieces are merged with a neighbour, longer ones are split.
+TTS_MAX_SEGMENT_CHARS = 300
+TTS_MIN_SEGMENT_CHARS = 40
+
+# Phoneme scores below this get an LLM feedback tip and count as "weak" in the score history.
+FEEDBACK_THRESHOLD = 3.5
+# Directory for the per-learner score history files (defaults to backend/score_history).
+# Set it to an empty string to keep history in memory only.
+SCORE_HISTORY_DIR = os.getenv(
+    "SCORE_HISTORY_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "score_history")
+)
+# Number of most recent attempts per phoneme used for the "recent" mean score.
+SCORE_HISTORY_RECENT_WINDOW = int(os.getenv("SCORE_HISTORY_RECENT_WINDOW", "20"))
\ No newline at end of file
@@ -1,8 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.v1.api import api_router
+from app.services.score_history_service import ScoreHistoryService
 from fastapi.middleware.cors import CORSMiddleware
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Wait for the background writer so queued score history is not lost on shutdown/reload.
+    ScoreHistoryService().flush()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Pronunciation Teacher API",
     description="An API to assess English pronunciation using a three-stage feedback pipeline.",
     version="1.0.0"
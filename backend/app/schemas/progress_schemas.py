@@ -0,0 +1,18 @@
+# backend/app/schemas/progress_schemas.py
+
+from pydantic import BaseModel
+from typing import List
+
+class PhonemeStats(BaseModel):
+    """Aggregated score history for one phoneme of one learner."""
+    phoneme: str
+    attempts: int
+    mean_score: float
+    recent_mean_score: float
+    recent_attempts: int
+    below_threshold_count: int
+
+class LearnerProgressResponse(BaseModel):
+    """Per-phoneme score trends for a learner."""
+    learner_id: str
+    phonemes: List[PhonemeStats]
@@ -6,6 +6,7 @@ import sys
 import torch
 import whisper
 import tempfile
+import threading
 
 # Add the project root to the Python path
 # This allows us to import from the 'app' module
@@ -13,36 +14,61 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.core.config import WHISPER_MODEL_NAME
+from app.core.config import WHISPER_MODELS, DEFAULT_MODEL_TIER
+from app.services.model_registry import ModelRegistry
 
 class ASRService:
     _instance = None
-    _model = None
+    _registry = None
+    # One lock per Whisper model: decoding installs KV-cache hooks on the model,
+    # so two transcriptions must never run on the same model at once.
+    _inference_locks = {}
+    _locks_guard = threading.Lock()
 
-    # Singleton pattern to ensure only one model instance is loaded
+    # Singleton pattern; the Whisper models themselves live in the shared ModelRegistry
+    # and are loaded lazily, one per tier, the first time that tier is requested.
     def __new__(cls):
         if cls._instance is None:
-            print("Creating ASRService instance and loading Whisper model...")
+            print("Creating ASRService instance...")
             cls._instance = super(ASRService, cls).__new__(cls)
-            try:
-                # Load the Whisper model
-                cls._model = whisper.load_model(WHISPER_MODEL_NAME)
-                print(f"Whisper model '{WHISPER_MODEL_NAME}' loaded successfully.")
-                # Check for GPU and move model if available
-                if torch.cuda.is_available():
-                    cls._model = cls._model.to('cuda')
-                    print("Model moved to GPU.")
-            except Exception as e:
-                print(f"Error loading Whisper model: {e}")
-                raise RuntimeError(f"Failed to load ASR model: {e}") from e
+            cls._registry = ModelRegistry()
+            cls._registry.preload("whisper", cls._load_whisper)
         return cls._instance
 
-    def transcribe(self, audio_bytes: bytes) -> str:
+    @staticmethod
+    def _load_whisper(model_name: str):
+        try:
+            model = whisper.load_model(model_name)
+            print(f"Whisper model '{model_name}' loaded successfully.")
+            # Check for GPU and move model if available
+            if torch.cuda.is_available():
+                model = model.to('cuda')
+                print("Model moved to GPU.")
+            return model
+        except Exception as e:
+            print(f"Error loading Whisper model: {e}")
+            raise RuntimeError(f"Failed to load ASR model: {e}") from e
+
+    def get_model(self, model_tier: str = None):
+        """
+        Returns the Whisper model for the given tier (see WHISPER_MODELS), loading it if needed.
+        """
+        model_tier = model_tier or DEFAULT_MODEL_TIER
+        if model_tier not in WHISPER_MODELS:
+            raise ValueError(f"Unknown model tier '{model_tier}'. Choose one of: {', '.join(WHISPER_MODELS)}")
+        model_name = WHISPER_MODELS[model_tier]
+        return self._registry.get("whisper", model_name, lambda: self._load_whisper(model_name))
+
+    def _inference_lock(self, model_tier: str = None) -> threading.Lock:
+        model_name = WHISPER_MODELS[model_tier or DEFAULT_MODEL_TIER]
+        with self._locks_guard:
+            return self._inference_locks.setdefault(model_name, threading.Lock())
+
+    def transcribe(self, audio_bytes: bytes, model_tier: str = None) -> str:
         """
         Transcribes the given audio bytes into text.
         """
-        if self._model is None:
-            raise Exception("Whisper model is not loaded.")
+        model = self.get_model(model_tier)
 
         print("Transcribing audio...")
         
@@ -54,7 +80,8 @@ class ASRService:
                 temp_audio_path = temp_audio_file.name
 
             # Transcribe the audio file
-            result = self._model.transcribe(temp_audio_path, fp16=torch.cuda.is_available())
+            with self._inference_lock(model_tier):
+                result = model.transcribe(temp_audio_path, fp16=torch.cuda.is_available())
             
             transcribed_text = result.get("text", "").strip()
             print(f"Transcription complete. Result: '{transcribed_text}'")
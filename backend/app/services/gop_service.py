@@ -9,7 +9,8 @@ import subprocess
 from g2p_en import G2p
 from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
 
-from app.core.config import GOP_MODEL_NAME
+from app.core.config import GOP_MODELS, DEFAULT_MODEL_TIER
+from app.services.model_registry import ModelRegistry
 
 ARPABET_TO_IPA = {
     # Vowels (Monophthongs)
@@ -43,32 +44,53 @@ ARPABET_TO_IPA = {
 
 class GOPService:
     _instance = None
-    _processor = None
-    _model = None
+    _registry = None
     _g2p = None
 
     def __new__(cls):
         if cls._instance is None:
-            print("Creating GOPService instance and loading models...")
+            print("Creating GOPService instance...")
             cls._instance = super(GOPService, cls).__new__(cls)
             try:
-                print(f"Loading processor from: {GOP_MODEL_NAME}")
-                cls._processor = Wav2Vec2Processor.from_pretrained(GOP_MODEL_NAME)
-                print(f"Loading model from: {GOP_MODEL_NAME}")
-                cls._model = Wav2Vec2ForCTC.from_pretrained(GOP_MODEL_NAME)
+                # The wav2vec2 processor/model pairs are loaded lazily per tier through the ModelRegistry.
+                cls._registry = ModelRegistry()
                 cls._g2p = G2p()
-                print("GOP models and converters loaded successfully.")
-                if torch.cuda.is_available():
-                    cls._model = cls._model.to('cuda')
-                    print("GOP model moved to GPU.")
+                print("GOP converters loaded successfully.")
+                cls._registry.preload("gop", cls._load_gop)
             except Exception as e:
-                print(f"Error loading GOP models: {e}")
+                print(f"Error loading GOP converters: {e}")
                 raise RuntimeError(f"Failed to load GOP models: {e}") from e
         return cls._instance
 
-    def get_phoneme_scores(self, audio_bytes: bytes, reference_text: str) -> list:
-        if not all([self._processor, self._model, self._g2p]):
+    @staticmethod
+    def _load_gop(model_name: str):
+        try:
+            print(f"Loading processor from: {model_name}")
+            processor = Wav2Vec2Processor.from_pretrained(model_name)
+            print(f"Loading model from: {model_name}")
+            model = Wav2Vec2ForCTC.from_pretrained(model_name)
+            if torch.cuda.is_available():
+                model = model.to('cuda')
+                print("GOP model moved to GPU.")
+            return processor, model
+        except Exception as e:
+            print(f"Error loading GOP models: {e}")
+            raise RuntimeError(f"Failed to load GOP models: {e}") from e
+
+    def get_models(self, model_tier: str = None):
+        """
+        Returns the (processor, model) pair for the given tier (see GOP_MODELS), loading it if needed.
+        """
+        model_tier = model_tier or DEFAULT_MODEL_TIER
+        if model_tier not in GOP_MODELS:
+            raise ValueError(f"Unknown model tier '{model_tier}'. Choose one of: {', '.join(GOP_MODELS)}")
+        model_name = GOP_MODELS[model_tier]
+        return self._registry.get("gop", model_name, lambda: self._load_gop(model_name))
+
+    def get_phoneme_scores(self, audio_bytes: bytes, reference_text: str, model_tier: str = None) -> list:
+        if not self._g2p:
             raise Exception("GOP service is not initialized correctly.")
+        processor, model = self.get_models(model_tier)
 
         arpabet_phonemes = self._g2p(reference_text)
         arpabet_phonemes = [p for p in arpabet_phonemes if p.strip() and p not in [' ', ',', '.', '!', '?']]
@@ -79,7 +101,7 @@ class GOPService:
         print(f"Step 2: Converted to IPA phonemes: {ipa_phonemes}")
 
         # --- MODIFIED PART 1: Get the full processed input object ---
-        processed_input, _ = self._process_audio(audio_bytes)
+        processed_input, _ = self._process_audio(audio_bytes, processor)
         
         if torch.cuda.is_available():
             # .to(device) works on the entire batch object
@@ -87,9 +109,9 @@ class GOPService:
 
         with torch.no_grad():
             # --- MODIFIED PART 2: Use ** to unpack the object for the model call ---
-            logits = self._model(**processed_input).logits[0]
+            logits = model(**processed_input).logits[0]
         
-        scores = self._calculate_gop(logits, ipa_phonemes)
+        scores = self._calculate_gop(logits, ipa_phonemes, processor)
         normalized_scores = self._normalize_scores(scores)
         result = self._map_scores_to_arpabet(arpabet_phonemes, ipa_phonemes_str, normalized_scores)
         print(f"Final phoneme scores: {result}")
@@ -111,7 +133,7 @@ class GOPService:
             score_cursor += num_chars
         return result
 
-    def _process_audio(self, audio_bytes: bytes):
+    def _process_audio(self, audio_bytes: bytes, processor):
         try:
             command = ['ffmpeg', '-i', '-', '-f', 's16le', '-ac', '1', '-ar', '16000', '-']
             proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
@@ -125,11 +147,11 @@ class GOPService:
         print("Audio decoded and processed successfully.")
         
         # --- MODIFIED: Return the entire processor output object, not just .input_values ---
-        processed_input = self._processor(audio_np, sampling_rate=16000, return_tensors="pt")
+        processed_input = processor(audio_np, sampling_rate=16000, return_tensors="pt")
         return processed_input, 16000
 
-    def _calculate_gop(self, logits, ipa_phonemes):
-        vocab = self._processor.tokenizer.get_vocab()
+    def _calculate_gop(self, logits, ipa_phonemes, processor):
+        vocab = processor.tokenizer.get_vocab()
         phoneme_ids = [vocab.get(p) for p in ipa_phonemes]
         if any(pid is None for pid in phoneme_ids):
             unknown_phonemes = [p for p, pid in zip(ipa_phonemes, phoneme_ids) if pid is None]
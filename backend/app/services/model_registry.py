@@ -0,0 +1,170 @@
+# backend/app/services/model_registry.py
+
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict, deque
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.core.config import MODEL_MEMORY_BUDGET_MB, MODEL_SIZE_ESTIMATES_MB, PINNED_MODELS
+
+
+def _estimate_model_bytes(obj) -> int:
+    """
+    Estimates the resident size of a loaded model from its parameters and buffers.
+    Tuples/lists (e.g. a processor + model pair) are summed; anything without
+    tensors (tokenizers, processors) counts as 0.
+    """
+    if isinstance(obj, (tuple, list)):
+        return sum(_estimate_model_bytes(o) for o in obj)
+    total = 0
+    if hasattr(obj, "parameters"):
+        total += sum(p.numel() * p.element_size() for p in obj.parameters())
+    if hasattr(obj, "buffers"):
+        total += sum(b.numel() * b.element_size() for b in obj.buffers())
+    return total
+
+
+class ModelRegistry:
+    """
+    A Singleton, memory-budgeted cache of loaded models shared by the ASR and GOP services.
+
+    Models are keyed by "kind:name" (e.g. "whisper:tiny.en") and loaded lazily on first use.
+    When a load would push the total resident size over MODEL_MEMORY_BUDGET_MB, the least
+    recently used models are evicted first. Keys listed in PINNED_MODELS are never evicted;
+    the ASR and GOP services load them at startup through `preload()`.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ModelRegistry, cls).__new__(cls)
+            cls._instance._models = OrderedDict()   # key -> loaded model, in LRU order
+            cls._instance._sizes = {}               # key -> bytes, kept after eviction as a load hint
+            cls._instance._lock = threading.Lock()
+            cls._instance._load_locks = {}
+            cls._instance._events = deque(maxlen=100)
+            cls._instance.budget_bytes = MODEL_MEMORY_BUDGET_MB * 1024 * 1024
+            cls._instance.pinned = set(PINNED_MODELS)
+        return cls._instance
+
+    @staticmethod
+    def make_key(kind: str, name: str) -> str:
+        return f"{kind}:{name}"
+
+    def get(self, kind: str, name: str, loader):
+        """
+        Returns the model for (kind, name), calling `loader()` to load it if it is not resident.
+        """
+        key = self.make_key(kind, name)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given model; others wait for it instead of loading a second copy.
+        with load_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key]
+                # Make room before loading, using the measured size from an earlier
+                # load if there was one, else the static estimate from config.
+                self._evict_to_fit(self._expected_bytes(key), exclude=key)
+
+            start = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - start
+            size = _estimate_model_bytes(model)
+
+            with self._lock:
+                self._evict_to_fit(size, exclude=key)
+                self._models[key] = model
+                self._sizes[key] = size
+                self._record("load", key, size, seconds=round(load_seconds, 2))
+                if self._resident_bytes() > self.budget_bytes:
+                    print(f"Warning: model memory ({self._resident_bytes() / 1e6:.0f} MB) is over budget "
+                          f"({self.budget_bytes / 1e6:.0f} MB) and nothing else can be evicted.")
+            return model
+
+    def preload(self, kind: str, loader):
+        """
+        Loads every pinned model of the given kind now, rather than on the first request.
+        `loader(name)` loads one model by name.
+        """
+        for key in sorted(self.pinned):
+            pinned_kind, _, name = key.partition(":")
+            if pinned_kind == kind:
+                self.get(kind, name, lambda: loader(name))
+
+    def evict(self, kind: str, name: str) -> bool:
+        """
+        Drops a resident model. Returns False if it was not loaded.
+        Pinned models cannot be evicted and raise a ValueError.
+        """
+        key = self.make_key(kind, name)
+        with self._lock:
+            if key in self.pinned:
+                raise ValueError(f"Model '{key}' is pinned and cannot be evicted.")
+            if key not in self._models:
+                return False
+            self._drop(key)
+            return True
+
+    def stats(self) -> dict:
+        """
+        Reports resident models (LRU first), their sizes, the budget and recent load/evict events.
+        """
+        with self._lock:
+            return {
+                "budget_mb": round(self.budget_bytes / (1024 * 1024), 1),
+                "resident_mb": round(self._resident_bytes() / (1024 * 1024), 1),
+                "models": [
+                    {
+                        "key": key,
+                        "resident_mb": round(self._sizes[key] / (1024 * 1024), 1),
+                        "pinned": key in self.pinned,
+                    }
+                    for key in self._models
+                ],
+                "events": list(self._events),
+            }
+
+    # --- Internal helpers (call with self._lock held) ---
+
+    def _expected_bytes(self, key: str) -> int:
+        if key in self._sizes:
+            return self._sizes[key]
+        return MODEL_SIZE_ESTIMATES_MB.get(key, 0) * 1024 * 1024
+
+    def _resident_bytes(self) -> int:
+        return sum(self._sizes[key] for key in self._models)
+
+    def _evict_to_fit(self, incoming_bytes: int, exclude: str):
+        for key in list(self._models):
+            if self._resident_bytes() + incoming_bytes <= self.budget_bytes:
+                break
+            if key in self.pinned or key == exclude:
+                continue
+            self._drop(key)
+
+    def _drop(self, key: str):
+        self._models.pop(key)
+        self._record("evict", key, self._sizes[key])
+        # Free cached GPU blocks held by the evicted model, if any.
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def _record(self, event: str, key: str, size: int, **extra):
+        entry = {"event": event, "key": key, "resident_mb": round(size / (1024 * 1024), 1), "time": time.time(), **extra}
+        self._events.append(entry)
+        print(f"ModelRegistry: {event} {key} ({entry['resident_mb']} MB)")
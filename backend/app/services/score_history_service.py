@@ -0,0 +1,229 @@
+# backend/app/services/score_history_service.py
+
+import os
+import re
+import sys
+import time
+import queue
+import hashlib
+import threading
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.core.config import FEEDBACK_THRESHOLD, SCORE_HISTORY_DIR, SCORE_HISTORY_RECENT_WINDOW
+
+# Base ARPAbet phonemes (stress digits are stripped), in a fixed order so that
+# phoneme ids stay stable in the on-disk history files.
+PHONEMES = [
+    'AA', 'AE', 'AH', 'AO', 'AW', 'AY', 'B', 'CH', 'D', 'DH', 'EH', 'EL', 'EM', 'EN', 'ER', 'EY',
+    'F', 'G', 'HH', 'IH', 'IY', 'JH', 'K', 'L', 'M', 'N', 'NG', 'NX', 'OW', 'OY', 'P', 'R',
+    'S', 'SH', 'T', 'TH', 'UH', 'UW', 'V', 'W', 'Y', 'Z', 'ZH',
+]
+PHONEME_IDS = {p: i for i, p in enumerate(PHONEMES)}
+
+# One row per scored phoneme; 14 bytes per phoneme on disk.
+RECORD_DTYPE = np.dtype([('timestamp', '<f8'), ('phoneme', '<u2'), ('score', '<f4')])
+
+
+def _base_phoneme(phoneme: str) -> str:
+    return re.sub(r'\d', '', phoneme).upper()
+
+
+class _LearnerHistory:
+    """
+    The rolling per-phoneme aggregates of one learner. The attempts themselves
+    are only kept on disk; appends update the aggregates in a vectorized pass.
+    """
+
+    def __init__(self, recent_window: int):
+        num_phonemes = len(PHONEMES)
+        self.counts = np.zeros(num_phonemes, dtype=np.int64)
+        self.sums = np.zeros(num_phonemes, dtype=np.float64)
+        self.below_threshold = np.zeros(num_phonemes, dtype=np.int64)
+        # Ring buffer of the last `recent_window` scores per phoneme, with a running sum.
+        self.recent = np.zeros((num_phonemes, recent_window), dtype=np.float32)
+        self.recent_sums = np.zeros(num_phonemes, dtype=np.float64)
+        self.recent_pos = np.zeros(num_phonemes, dtype=np.int64)
+
+    def append(self, new_records: np.ndarray):
+        num_phonemes, window = self.recent.shape
+        phoneme_ids = new_records['phoneme'].astype(np.intp)
+        scores = new_records['score'].astype(np.float64)
+        valid = phoneme_ids < num_phonemes
+        phoneme_ids, scores = phoneme_ids[valid], scores[valid]
+        if not len(phoneme_ids):
+            return
+
+        new_counts = np.bincount(phoneme_ids, minlength=num_phonemes)
+        self.counts += new_counts
+        self.sums += np.bincount(phoneme_ids, weights=scores, minlength=num_phonemes)
+        self.below_threshold += np.bincount(phoneme_ids[scores < FEEDBACK_THRESHOLD], minlength=num_phonemes)
+
+        # Rank of each new score within its phoneme (0 = oldest), so only the
+        # last `window` scores per phoneme are written into the ring buffer.
+        order = np.argsort(phoneme_ids, kind='stable')
+        sorted_ids = phoneme_ids[order]
+        group_starts = np.cumsum(new_counts) - new_counts
+        ranks = np.arange(len(sorted_ids)) - group_starts[sorted_ids]
+        keep = ranks >= new_counts[sorted_ids] - window
+        kept_ids = sorted_ids[keep]
+        slots = (self.recent_pos[kept_ids] + ranks[keep]) % window
+        self.recent[kept_ids, slots] = scores[order][keep]
+
+        touched = np.flatnonzero(new_counts)
+        self.recent_pos += new_counts
+        self.recent_sums[touched] = self.recent[touched].sum(axis=1)
+
+    def phoneme_stats(self) -> list:
+        window = self.recent.shape[1]
+        stats = []
+        for phoneme_id in np.flatnonzero(self.counts):
+            recent_count = min(int(self.recent_pos[phoneme_id]), window)
+            stats.append({
+                "phoneme": PHONEMES[phoneme_id],
+                "attempts": int(self.counts[phoneme_id]),
+                "mean_score": round(float(self.sums[phoneme_id] / self.counts[phoneme_id]), 2),
+                "recent_mean_score": round(float(self.recent_sums[phoneme_id] / recent_count), 2),
+                "recent_attempts": recent_count,
+                "below_threshold_count": int(self.below_threshold[phoneme_id]),
+            })
+        return stats
+
+
+class ScoreHistoryService:
+    """
+    A Singleton, append-only store of per-learner phoneme scores.
+
+    Assessments are handed to `record()`, which only enqueues them; a background
+    writer thread appends the raw scores to a per-learner binary file in SCORE_HISTORY_DIR
+    (replayed on first access) and then updates the learner's rolling aggregates.
+    Queries read the aggregates, so they cost O(phonemes), not O(attempts).
+    Call `flush()` on shutdown so queued assessments are not lost.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ScoreHistoryService, cls).__new__(cls)
+            cls._instance._histories = {}
+            cls._instance._lock = threading.Lock()
+            cls._instance._queue = queue.Queue()
+            cls._instance._history_dir = SCORE_HISTORY_DIR
+            cls._instance._recent_window = SCORE_HISTORY_RECENT_WINDOW
+            if cls._instance._history_dir:
+                os.makedirs(cls._instance._history_dir, exist_ok=True)
+            else:
+                print("Warning: SCORE_HISTORY_DIR is empty; learner score history is kept in memory "
+                      "only and will be lost on restart.")
+            writer = threading.Thread(target=cls._instance._writer_loop, name="score-history-writer", daemon=True)
+            writer.start()
+        return cls._instance
+
+    def record(self, learner_id: str, assessment) -> None:
+        """
+        Queues the phoneme scores of an AssessorResponse for learner_id. Returns immediately.
+        """
+        scores = [
+            (phoneme.phoneme, phoneme.score)
+            for word in assessment.words
+            for phoneme in word.phonemes
+        ]
+        if scores:
+            self._queue.put((learner_id, time.time(), scores))
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued assessment has been written.
+        """
+        self._queue.join()
+
+    def get_phoneme_stats(self, learner_id: str) -> list:
+        """
+        Returns per-phoneme aggregates for a learner (empty if they have no history).
+        """
+        with self._lock:
+            history = self._get_history(learner_id, create=False)
+            return history.phoneme_stats() if history else []
+
+    def get_weakest_phonemes(self, learner_id: str, limit: int = 5, min_attempts: int = 3) -> list:
+        """
+        Returns the learner's weakest phonemes, lowest recent mean score first.
+        Phonemes with fewer than `min_attempts` attempts are skipped as too noisy.
+        """
+        stats = [s for s in self.get_phoneme_stats(learner_id) if s["attempts"] >= min_attempts]
+        stats.sort(key=lambda s: (s["recent_mean_score"], -s["below_threshold_count"]))
+        return stats[:limit]
+
+    # --- Internal helpers ---
+
+    def _writer_loop(self):
+        while True:
+            learner_id, timestamp, scores = self._queue.get()
+            try:
+                self._write(learner_id, timestamp, scores)
+            except Exception as e:
+                print(f"Error writing score history for learner '{learner_id}': {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, learner_id: str, timestamp: float, scores: list):
+        rows = []
+        for phoneme, score in scores:
+            phoneme_id = PHONEME_IDS.get(_base_phoneme(phoneme))
+            if phoneme_id is None:
+                print(f"Warning: phoneme '{phoneme}' is not tracked in score history. Skipping.")
+                continue
+            rows.append((timestamp, phoneme_id, score))
+        if not rows:
+            return
+        new_records = np.array(rows, dtype=RECORD_DTYPE)
+
+        with self._lock:
+            # Load any existing file before appending to it, then write to disk first so
+            # the in-memory aggregates only change once the records are persisted.
+            history = self._get_history(learner_id, create=True)
+            if self._history_dir:
+                with open(self._history_path(learner_id), "ab") as f:
+                    new_records.tofile(f)
+            history.append(new_records)
+
+    def _get_history(self, learner_id: str, create: bool):
+        """
+        Returns the in-memory history for a learner, loading it from disk on first access.
+        Must be called with self._lock held.
+        """
+        history = self._histories.get(learner_id)
+        if history is not None:
+            return history
+
+        path = self._history_path(learner_id) if self._history_dir else None
+        if path and os.path.exists(path):
+            history = _LearnerHistory(self._recent_window)
+            history.append(self._read_records(path))
+        elif create:
+            history = _LearnerHistory(self._recent_window)
+        else:
+            return None
+        self._histories[learner_id] = history
+        return history
+
+    @staticmethod
+    def _read_records(path: str) -> np.ndarray:
+        """
+        Reads a learner's history file. A trailing partial record (from a write torn
+        by a crash) is truncated away so later appends stay aligned.
+        """
+        file_size = os.path.getsize(path)
+        torn_bytes = file_size % RECORD_DTYPE.itemsize
+        if torn_bytes:
+            print(f"Warning: dropping {torn_bytes} trailing bytes of a partial record in '{path}'.")
+            os.truncate(path, file_size - torn_bytes)
+        return np.fromfile(path, dtype=RECORD_DTYPE)
+
+    def _history_path(self, learner_id: str) -> str:
+        # Hash the id so any learner id is a safe file name.
+        digest = hashlib.sha256(learner_id.encode("utf-8")).hexdigest()
+        return os.path.join(self._history_dir, f"{digest}.bin")
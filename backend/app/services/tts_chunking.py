@@ -0,0 +1,100 @@
+# backend/app/services/tts_chunking.py
+
+import re
+import sys
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.core.config import TTS_MAX_WORKERS, TTS_MAX_SEGMENT_CHARS, TTS_MIN_SEGMENT_CHARS
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Shared by every request, so TTS_MAX_WORKERS caps synthesis calls for the whole service.
+_executor = ThreadPoolExecutor(max_workers=TTS_MAX_WORKERS, thread_name_prefix="tts")
+
+
+def split_sentences(
+    text: str,
+    max_chars: int = TTS_MAX_SEGMENT_CHARS,
+    min_chars: int = TTS_MIN_SEGMENT_CHARS
+) -> List[str]:
+    """
+    Splits text into sentence-sized segments for synthesis.
+    A segment shorter than `min_chars` (e.g. "Dr." or "Ok!") absorbs the following
+    sentence; a short last piece is attached to the segment before it. Sentences
+    longer than `max_chars` are split on word boundaries.
+    """
+    segments = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if segments and len(segments[-1]) < min_chars and len(segments[-1]) + 1 + len(sentence) <= max_chars:
+            segments[-1] = f"{segments[-1]} {sentence}"
+        else:
+            segments.append(sentence)
+    if len(segments) > 1 and len(segments[-1]) < min_chars \
+            and len(segments[-2]) + 1 + len(segments[-1]) <= max_chars:
+        last = segments.pop()
+        segments[-1] = f"{segments[-1]} {last}"
+
+    bounded = []
+    for segment in segments:
+        while len(segment) > max_chars:
+            cut = segment.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            bounded.append(segment[:cut].strip())
+            segment = segment[cut:].strip()
+        if segment:
+            bounded.append(segment)
+    return bounded
+
+
+def stream_speech(
+    synthesize: Callable[[str, str], Optional[bytes]],
+    text: str,
+    voice: str,
+    max_in_flight: int = TTS_MAX_WORKERS
+) -> Iterator[bytes]:
+    """
+    Synthesizes `text` one sentence at a time on the shared TTS thread pool and yields
+    each segment's MP3 bytes in order, as soon as that segment (and all before it) are ready.
+
+    At most `max_in_flight` segments of this request are queued at once, so long texts
+    don't flood the pool. MP3 frames are self-contained, so the segments can be
+    concatenated as-is into one playable stream.
+
+    Args:
+        synthesize: A backend's `generate_speech(text, voice)`; returns bytes or None on failure.
+    """
+    segments = split_sentences(text)
+    if not segments:
+        return
+
+    remaining = iter(segments)
+    pending = deque()
+    try:
+        for segment in remaining:
+            pending.append(_executor.submit(synthesize, segment, voice))
+            if len(pending) >= max_in_flight:
+                break
+
+        while pending:
+            audio_bytes = pending.popleft().result()
+            if not audio_bytes:
+                raise RuntimeError("Failed to generate audio for a text segment.")
+            next_segment = next(remaining, None)
+            if next_segment is not None:
+                pending.append(_executor.submit(synthesize, next_segment, voice))
+            yield audio_bytes
+    finally:
+        # Stop any queued work if the client disconnects or a segment fails.
+        for future in pending:
+            future.cancel()
@@ -4,6 +4,7 @@ import sys
 import os
 from gtts import gTTS
 import io
+from typing import Iterator
 
 # --- Path Setup ---
 # This part is kept for structural consistency with your project.
@@ -11,6 +12,8 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from app.services.tts_chunking import stream_speech
+
 
 class TTSService:
     """
@@ -59,4 +62,11 @@ class TTSService:
         except Exception as e:
             # Catches potential network errors or other gTTS issues.
             print(f"Error generating speech with gTTS: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def generate_speech_stream(self, text: str, voice: str = "en") -> Iterator[bytes]:
+        """
+        Same as generate_speech, but synthesizes sentence by sentence in parallel
+        and yields the MP3 bytes of each sentence in order as soon as it is ready.
+        """
+        return stream_speech(self.generate_speech, text, voice)
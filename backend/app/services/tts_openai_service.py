@@ -5,7 +5,9 @@ from openai import OpenAI
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+from typing import Iterator
 from app.core.config import OPENAI_API_KEY
+from app.services.tts_chunking import stream_speech
 
 class TTSService:
     _instance = None
@@ -41,3 +43,10 @@ class TTSService:
         except Exception as e:
             print(f"Error generating speech: {e}")
             return None
+
+    def generate_speech_stream(self, text: str, voice: str = "alloy") -> Iterator[bytes]:
+        """
+        Same as generate_speech, but synthesizes sentence by sentence in parallel
+        and yields the MP3 bytes of each sentence in order as soon as it is ready.
+        """
+        return stream_speech(self.generate_speech, text, voice)
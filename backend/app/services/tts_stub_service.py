@@ -0,0 +1,42 @@
+# backend/app/services/tts_stub_service.py
+
+import sys
+import os
+import time
+from typing import Iterator
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.services.tts_chunking import stream_speech
+
+
+class TTSService:
+    """
+    An offline stand-in for the gTTS/OpenAI services, for tests and local development.
+    It returns a short placeholder payload per call instead of real MP3 audio.
+    """
+    _instance = None
+    # Simulated synthesis latency per call, in seconds.
+    delay_seconds = 0.0
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TTSService, cls).__new__(cls)
+        return cls._instance
+
+    def generate_speech(self, text: str, voice: str = "en"):
+        """
+        Returns deterministic placeholder bytes for the given text.
+        """
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        return f"[{voice}] {text}\n".encode("utf-8")
+
+    def generate_speech_stream(self, text: str, voice: str = "en") -> Iterator[bytes]:
+        """
+        Same as generate_speech, but synthesizes sentence by sentence in parallel
+        and yields each sentence's bytes in order as soon as it is ready.
+        """
+        return stream_speech(self.generate_speech, text, voice)
@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+
+import os
+import sys
+
+# Make the 'app' package importable when running pytest from the backend directory.
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -0,0 +1,113 @@
+# backend/tests/test_assessment_stream.py
+
+import json
+import sys
+import types
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+REFERENCE_TEXT = "I saw a ship"
+
+_WORD_PHONEMES = {
+    "i": ["AY1"],
+    "saw": ["S", "AO1"],
+    "a": ["AH0"],
+    "ship": ["SH", "IH1", "P"],
+}
+_SCORES = [4.8, 4.5, 2.0, 4.0, 4.6, 2.1, 4.7]
+
+
+class _FakeG2p:
+    def __call__(self, text):
+        phonemes = []
+        for word in text.lower().split():
+            phonemes.extend(_WORD_PHONEMES[word])
+            phonemes.append(' ')
+        return phonemes
+
+
+class _FakeASRService:
+    def transcribe(self, audio_bytes, model_tier=None):
+        if audio_bytes == b"boom":
+            raise RuntimeError("decoder exploded")
+        return REFERENCE_TEXT
+
+
+class _FakeGOPService:
+    def get_phoneme_scores(self, audio_bytes, reference_text, model_tier=None):
+        phonemes = [p for word in reference_text.lower().split() for p in _WORD_PHONEMES[word]]
+        return [{"phoneme": p, "score": s} for p, s in zip(phonemes, _SCORES)]
+
+
+class _FakeFeedbackService:
+    def get_pronunciation_tip(self, phoneme, word, reference_text):
+        return f"tip for {phoneme} in {word}"
+
+
+def _fake_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Swap the model-backed services for fakes before the endpoint module instantiates them.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "g2p_en", _fake_module("g2p_en", G2p=_FakeG2p))
+        mp.setitem(sys.modules, "app.services.asr_service",
+                   _fake_module("app.services.asr_service", ASRService=_FakeASRService))
+        mp.setitem(sys.modules, "app.services.gop_service",
+                   _fake_module("app.services.gop_service", GOPService=_FakeGOPService))
+        mp.setitem(sys.modules, "app.services.feedback_service",
+                   _fake_module("app.services.feedback_service", FeedbackService=_FakeFeedbackService))
+        mp.delitem(sys.modules, "app.api.v1.endpoints.assessment", raising=False)
+
+        from app.api.v1.endpoints import assessment
+
+        app = FastAPI()
+        app.include_router(assessment.router, prefix="/assessment")
+        yield TestClient(app)
+
+        mp.delitem(sys.modules, "app.api.v1.endpoints.assessment", raising=False)
+
+
+def _post(client, path, audio=b"audio", **form):
+    return client.post(
+        path,
+        data={"reference_text": REFERENCE_TEXT, **form},
+        files={"audio_file": ("recording.webm", audio, "audio/webm")},
+    )
+
+
+def _events(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_stream_emits_stages_in_order_and_matches_full_response(client):
+    events = _events(_post(client, "/assessment/stream"))
+    kinds = [e["event"] for e in events]
+
+    assert kinds == ["checker"] + ["word"] * 4 + ["feedback"] * 2 + ["result"]
+    assert events[0]["data"] == {"is_correct": True, "user_transcript": REFERENCE_TEXT}
+    # Word events are sent before any tip is known.
+    assert all(p["feedback_tip"] is None for e in events[1:5] for p in e["data"]["word"]["phonemes"])
+    assert {(e["data"]["word_index"], e["data"]["phoneme_index"]) for e in events[5:7]} == {(1, 1), (3, 1)}
+
+    full = _post(client, "/assessment/")
+    assert full.status_code == 200
+    assert events[-1]["data"] == full.json()
+    assert full.json()["words"][3]["phonemes"][1]["feedback_tip"] == "tip for IH1 in ship"
+
+
+def test_stream_reports_stage_failure_as_error_event(client):
+    events = _events(_post(client, "/assessment/stream", audio=b"boom"))
+    assert events == [{"event": "error", "data": {"detail": "decoder exploded"}}]
+
+
+@pytest.mark.parametrize("path", ["/assessment/", "/assessment/stream"])
+def test_unknown_model_tier_is_rejected(client, path):
+    response = _post(client, path, model_tier="enormous")
+    assert response.status_code == 400
@@ -0,0 +1,108 @@
+# backend/tests/test_model_registry.py
+
+import pytest
+
+from app.services.model_registry import ModelRegistry
+
+MB = 1024 * 1024
+
+
+class _FakeTensor:
+    def __init__(self, num_bytes):
+        self._num_bytes = num_bytes
+
+    def numel(self):
+        return self._num_bytes
+
+    def element_size(self):
+        return 1
+
+
+class _FakeModel:
+    def __init__(self, size_mb):
+        self._params = [_FakeTensor(size_mb * MB)]
+
+    def parameters(self):
+        return self._params
+
+
+@pytest.fixture
+def registry():
+    ModelRegistry._instance = None
+    registry = ModelRegistry()
+    registry.budget_bytes = 100 * MB
+    registry.pinned = set()
+    yield registry
+    ModelRegistry._instance = None
+
+
+def _loader(size_mb, calls):
+    def load():
+        calls.append(size_mb)
+        return _FakeModel(size_mb)
+    return load
+
+
+def test_get_loads_once_and_reuses(registry):
+    calls = []
+    first = registry.get("whisper", "a", _loader(10, calls))
+    second = registry.get("whisper", "a", _loader(10, calls))
+    assert first is second
+    assert calls == [10]
+    assert registry.stats()["models"] == [{"key": "whisper:a", "resident_mb": 10.0, "pinned": False}]
+
+
+def test_least_recently_used_model_is_evicted(registry):
+    calls = []
+    registry.get("whisper", "a", _loader(40, calls))
+    registry.get("whisper", "b", _loader(40, calls))
+    registry.get("whisper", "a", _loader(40, calls))  # touch 'a' so 'b' is LRU
+    registry.get("whisper", "c", _loader(40, calls))
+
+    resident = [m["key"] for m in registry.stats()["models"]]
+    assert resident == ["whisper:a", "whisper:c"]
+    assert [e["event"] for e in registry.stats()["events"]] == ["load", "load", "evict", "load"]
+
+
+def test_pinned_models_are_never_evicted(registry):
+    registry.pinned = {"whisper:a"}
+    calls = []
+    registry.get("whisper", "a", _loader(40, calls))
+    registry.get("whisper", "b", _loader(40, calls))
+    registry.get("whisper", "c", _loader(40, calls))
+
+    resident = [m["key"] for m in registry.stats()["models"]]
+    assert resident == ["whisper:a", "whisper:c"]
+    with pytest.raises(ValueError):
+        registry.evict("whisper", "a")
+
+
+def test_eviction_happens_before_first_load_using_estimate(registry, monkeypatch):
+    monkeypatch.setattr("app.services.model_registry.MODEL_SIZE_ESTIMATES_MB", {"whisper:big": 80})
+    calls = []
+    registry.get("whisper", "a", _loader(40, calls))
+
+    def load_big():
+        # 'a' must already be gone when the big model starts loading.
+        assert [m["key"] for m in registry.stats()["models"]] == []
+        return _FakeModel(80)
+
+    registry.get("whisper", "big", load_big)
+    assert [m["key"] for m in registry.stats()["models"]] == ["whisper:big"]
+
+
+def test_evict_unloaded_model_returns_false(registry):
+    assert registry.evict("gop", "missing") is False
+
+
+def test_preload_loads_only_pinned_models_of_that_kind(registry):
+    registry.pinned = {"whisper:a", "gop:g"}
+    loaded = []
+
+    def load(name):
+        loaded.append(name)
+        return _FakeModel(10)
+
+    registry.preload("whisper", load)
+    assert loaded == ["a"]
+    assert [m["key"] for m in registry.stats()["models"]] == ["whisper:a"]
@@ -0,0 +1,124 @@
+# backend/tests/test_score_history.py
+
+import os
+
+import numpy as np
+import pytest
+
+from app.core.config import FEEDBACK_THRESHOLD
+from app.services.score_history_service import (
+    PHONEME_IDS,
+    RECORD_DTYPE,
+    ScoreHistoryService,
+    _LearnerHistory,
+)
+from app.schemas.assessment_schemas import AssessorResponse, PhonemeScore, WordAnalysis
+
+
+def _records(phonemes, scores):
+    records = np.zeros(len(phonemes), dtype=RECORD_DTYPE)
+    records['phoneme'] = [PHONEME_IDS[p] for p in phonemes]
+    records['score'] = scores
+    return records
+
+
+def _stats_by_phoneme(history):
+    return {s["phoneme"]: s for s in history.phoneme_stats()}
+
+
+def test_aggregates_and_recent_window():
+    history = _LearnerHistory(recent_window=3)
+    history.append(_records(["IH"] * 5 + ["SH"], [1.0, 2.0, 4.0, 5.0, 5.0, 4.5]))
+
+    ih = _stats_by_phoneme(history)["IH"]
+    assert ih["attempts"] == 5
+    assert ih["mean_score"] == 3.4
+    assert ih["recent_attempts"] == 3
+    assert ih["recent_mean_score"] == pytest.approx((4.0 + 5.0 + 5.0) / 3, abs=0.01)
+    assert ih["below_threshold_count"] == 2
+
+
+def test_ring_buffer_matches_naive_across_batches():
+    rng = np.random.default_rng(0)
+    window = 5
+    history = _LearnerHistory(recent_window=window)
+    all_ids, all_scores = [], []
+    for _ in range(30):
+        n = int(rng.integers(1, 40))
+        ids = rng.integers(0, 6, n)
+        scores = rng.uniform(1, 5, n).round(1)
+        batch = np.zeros(n, dtype=RECORD_DTYPE)
+        batch['phoneme'] = ids
+        batch['score'] = scores
+        history.append(batch)
+        all_ids.extend(ids)
+        all_scores.extend(batch['score'])
+
+    all_ids, all_scores = np.array(all_ids), np.array(all_scores, dtype=np.float64)
+    for phoneme_id in range(6):
+        scores = all_scores[all_ids == phoneme_id]
+        assert history.counts[phoneme_id] == len(scores)
+        assert history.sums[phoneme_id] == pytest.approx(scores.sum())
+        assert history.recent_sums[phoneme_id] == pytest.approx(scores[-window:].sum())
+        assert history.below_threshold[phoneme_id] == (scores < FEEDBACK_THRESHOLD).sum()
+
+
+def test_out_of_range_phoneme_ids_are_ignored():
+    history = _LearnerHistory(recent_window=3)
+    records = np.zeros(2, dtype=RECORD_DTYPE)
+    records['phoneme'] = [PHONEME_IDS["AA"], 60000]
+    records['score'] = [4.0, 1.0]
+    history.append(records)
+    assert list(_stats_by_phoneme(history)) == ["AA"]
+
+
+@pytest.fixture
+def service(tmp_path):
+    ScoreHistoryService._instance = None
+    service = ScoreHistoryService()
+    service._history_dir = str(tmp_path)
+    service._recent_window = 3
+    yield service
+    ScoreHistoryService._instance = None
+
+
+def _assessment(*phoneme_scores):
+    return AssessorResponse(
+        is_correct=True,
+        user_transcript="",
+        words=[WordAnalysis(word="w", phonemes=[PhonemeScore(phoneme=p, score=s) for p, s in phoneme_scores])]
+    )
+
+
+def test_record_persists_and_reloads(service):
+    for score in [1.0, 2.0, 4.0]:
+        service.record("learner", _assessment(("IH1", score), ("SH", 4.5)))
+    service.flush()
+    before = service.get_phoneme_stats("learner")
+
+    service._histories.clear()
+    assert service.get_phoneme_stats("learner") == before
+    assert [s["phoneme"] for s in service.get_weakest_phonemes("learner", limit=1)] == ["IH"]
+
+
+def test_torn_write_is_truncated_on_load(service):
+    service.record("learner", _assessment(("IH1", 2.0), ("SH", 4.5)))
+    service.flush()
+    path = service._history_path("learner")
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    service._histories.clear()
+    assert {s["phoneme"] for s in service.get_phoneme_stats("learner")} == {"IH", "SH"}
+    assert os.path.getsize(path) % RECORD_DTYPE.itemsize == 0
+
+
+def test_failed_file_append_leaves_aggregates_unchanged(service, tmp_path):
+    service.record("learner", _assessment(("IH1", 2.0)))
+    service.flush()
+    before = service.get_phoneme_stats("learner")
+
+    service._history_dir = str(tmp_path / "missing")
+    service.record("learner", _assessment(("IH1", 5.0)))
+    service.flush()
+    assert service.get_phoneme_stats("learner") == before
@@ -0,0 +1,121 @@
+# backend/tests/test_tts_chunking.py
+
+import threading
+import time
+
+import pytest
+
+from app.core.config import TTS_MAX_WORKERS
+from app.services.tts_chunking import split_sentences, stream_speech
+from app.services.tts_stub_service import TTSService
+
+
+@pytest.fixture
+def stub_tts():
+    service = TTSService()
+    yield service
+    service.delay_seconds = 0.0
+
+
+def test_split_sentences_merges_abbreviations_and_short_clauses():
+    assert split_sentences("Dr. Smith said: fine; ok!") == ["Dr. Smith said: fine; ok!"]
+
+
+def test_split_sentences_keeps_full_sentences_separate():
+    text = "This is the first full sentence of the lesson. And here is the second full sentence of it!"
+    assert split_sentences(text) == [
+        "This is the first full sentence of the lesson.",
+        "And here is the second full sentence of it!",
+    ]
+
+
+def test_split_sentences_keeps_paragraph_of_short_sentences_in_several_segments():
+    text = ("Sam has a big red hat. The hat is on the mat. The cat sat on it. "
+            "Sam is sad. He wants his hat back. The cat runs off. Sam gets the hat. Now Sam is happy.")
+    segments = split_sentences(text)
+    assert len(segments) > 1
+    assert all(len(s) >= 40 for s in segments)
+    assert " ".join(segments) == text
+
+
+def test_split_sentences_attaches_short_last_piece_to_previous_segment():
+    text = "This is the first full sentence of the lesson. Ok."
+    assert split_sentences(text) == [text]
+
+
+def test_split_sentences_cuts_long_sentences_on_word_boundaries():
+    segments = split_sentences("word " * 200, max_chars=100)
+    assert all(len(s) <= 100 for s in segments)
+    assert " ".join(segments).split() == ["word"] * 200
+
+
+def test_stream_speech_yields_segments_in_order(stub_tts):
+    stub_tts.delay_seconds = 0.05
+    sentences = [f"This is sentence number {i} of the lesson text." for i in range(8)]
+    chunks = list(stub_tts.generate_speech_stream(" ".join(sentences)))
+    assert chunks == [f"[en] {s}\n".encode("utf-8") for s in sentences]
+
+
+def test_stream_speech_limits_concurrency_across_requests():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def synthesize(text, voice):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return text.encode("utf-8")
+
+    text = " ".join(f"This is sentence number {i} of the lesson text." for i in range(10))
+    streams = [threading.Thread(target=lambda: list(stream_speech(synthesize, text, "en"))) for _ in range(3)]
+    for t in streams:
+        t.start()
+    for t in streams:
+        t.join()
+
+    assert 1 < peak <= TTS_MAX_WORKERS
+
+
+def test_stream_speech_yields_first_chunk_before_later_segments_finish():
+    release = threading.Event()
+    segment_2_started = threading.Event()
+
+    def synthesize(text, voice):
+        if "number 2 " in text:
+            segment_2_started.set()
+            release.wait(5)
+        return text.encode("utf-8")
+
+    text = " ".join(f"This is sentence number {i} of the lesson text." for i in range(4))
+    chunks = stream_speech(synthesize, text, "en")
+    try:
+        first = next(chunks)
+        assert first.startswith(b"This is sentence number 0")
+        assert segment_2_started.wait(1)
+        assert not release.is_set()
+    finally:
+        release.set()
+    assert len(list(chunks)) == 3
+
+
+def test_stream_speech_stops_on_failed_segment():
+    calls = []
+
+    def synthesize(text, voice):
+        calls.append(text)
+        return None if "number 1 " in text else text.encode("utf-8")
+
+    text = " ".join(f"This is sentence number {i} of the lesson text." for i in range(10))
+    chunks = stream_speech(synthesize, text, "en", max_in_flight=2)
+
+    assert next(chunks).startswith(b"This is sentence number 0")
+    with pytest.raises(RuntimeError):
+        next(chunks)
+    time.sleep(0.05)
+    # Only the in-flight window was ever submitted, not the whole text.
+    assert len(calls) <= 3